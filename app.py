@@ -28,15 +28,19 @@ uploaded_file = st.sidebar.file_uploader("Upload custom text", type="txt")
 # Display text (user can adjust the speed of words per minute)
 if selected_text or uploaded_file:
     if uploaded_file:
-        current_text = text_parser.load_text_from_file(uploaded_file)
+        try:
+            current_text = text_parser.load_text_from_file(uploaded_file)
+        except UnicodeDecodeError:
+            st.error("Could not read the uploaded text. Please upload a UTF-8 encoded file.")
     else:
         current_text = text_parser.load_text_from_file(f"data/pre_texts/{selected_text}.txt")
 
-    st.subheader("Text to Memorize")
-    st.write(current_text)
+    if current_text is not None:
+        st.subheader("Text to Memorize")
+        st.write(current_text)
 
-    words_per_minute = st.slider("Words per Minute", min_value=50, max_value=300, value=150)
-    st.text(f"Text scrolling at {words_per_minute} WPM")
+        words_per_minute = st.slider("Words per Minute", min_value=50, max_value=300, value=150)
+        st.text(f"Text scrolling at {words_per_minute} WPM")
 
 # Audio Input and Processing
 st.subheader("Audio Input")
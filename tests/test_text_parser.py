@@ -1,5 +1,8 @@
 # ./tests/test_text_parser.py
 import unittest
+import io
+import os
+import tempfile
 from utils import text_parser
 
 class TestTextParser(unittest.TestCase):
@@ -9,6 +12,35 @@ class TestTextParser(unittest.TestCase):
         expected = "This is a sample text for testing."
         self.assertEqual(result, expected)
     
+    def test_load_text_from_utf8_file(self):
+        """Paths are decoded as UTF-8 regardless of locale."""
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as file:
+            file.write("Café déjà vu".encode('utf-8'))
+        try:
+            self.assertEqual(text_parser.load_text_from_file(file.name), "Café déjà vu")
+        finally:
+            os.remove(file.name)
+
+    def test_load_text_from_uploaded_file(self):
+        # Simulate an uploaded binary file already read up to offset 4
+        uploaded_file = io.BytesIO("abc This is a sample text for testing.".encode('utf-8'))
+        uploaded_file.seek(4)
+        result = text_parser.load_text_from_file(uploaded_file)
+        self.assertEqual(result, "This is a sample text for testing.")
+        self.assertFalse(uploaded_file.closed)
+        self.assertEqual(uploaded_file.tell(), 4)
+
+    def test_load_text_from_invalid_utf8_upload(self):
+        """Invalid UTF-8 raises and leaves the upload where it started."""
+        uploaded_file = io.BytesIO(b"caf\xe9")
+        with self.assertRaises(UnicodeDecodeError):
+            text_parser.load_text_from_file(uploaded_file)
+        self.assertEqual(uploaded_file.tell(), 0)
+
+    def test_load_text_from_text_stream(self):
+        """Text-mode streams are read as-is."""
+        self.assertEqual(text_parser.load_text_from_file(io.StringIO("hi")), "hi")
+
     def test_compare_text(self):
         # Test transcribed text comparison
         original_text = "This is a sample text"
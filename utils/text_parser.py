@@ -1,7 +1,22 @@
 # ./utils/text_parser.py
+import io
+
 def load_text_from_file(filepath):
-    """Load text from a file and return it as a string."""
-    with open(filepath, 'r') as file:
+    """Load text from a file path or an uploaded file and return it as a string."""
+    if isinstance(filepath, io.TextIOBase):
+        return filepath.read()
+    if isinstance(filepath, (io.BufferedIOBase, io.RawIOBase)):
+        start = filepath.tell() if filepath.seekable() else None
+        text_stream = io.TextIOWrapper(filepath, encoding='utf-8')
+        try:
+            return text_stream.read()
+        finally:
+            # Detach so closing the wrapper doesn't close the caller's upload,
+            # then rewind to where the caller started so it can be read again
+            text_stream.detach()
+            if start is not None:
+                filepath.seek(start)
+    with open(filepath, 'r', encoding='utf-8') as file:
         text = file.read()
     return text
 
@@ -18,13 +33,14 @@ def format_text(text, title=None, time_limit=None, description=None, tags=None):
 
 def compare_text(transcribed_text, original_text):
     """Compare transcribed text with the original text and highlight differences."""
+    original_words = original_text.split()
     differences = []
-    for original_word, transcribed_word in zip(original_text.split(), transcribed_text.split()):
+    for original_word, transcribed_word in zip(original_words, transcribed_text.split()):
         if original_word != transcribed_word:
             differences.append((original_word, transcribed_word))
     
     return {
-        'total_words': len(original_text.split()),
+        'total_words': len(original_words),
         'errors': len(differences),
         'differences': differences
     }
\ No newline at end of file